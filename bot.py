@@ -5,13 +5,24 @@ This module initializes the Telegram bot application with all handlers
 and starts the polling loop to receive and process user messages.
 """
 
-from config import API_KEY
+from config import (
+    POLLING_TIMEOUT,
+    WEBHOOK_URL,
+    WEBHOOK_SECRET,
+    WEBHOOK_PORT,
+    RUN_REMINDERS_IN_PROCESS,
+    REMINDER_CHECK_INTERVAL,
+)
+from telegram import Update
 from telegram.ext import ApplicationBuilder
-from handlers.start_handler import start_handler
-from handlers.help_handler import help_handler
-from handlers.set_reminder_handler import set_reminder_handler
-from handlers.list_reminders_handler import list_reminders_handler
-from handlers.clear_all_handler import clear_all_handler
+from handlers import ALL_HANDLERS
+from utils.db import get_db_manager
+from utils.telegram_bot import get_bot
+from utils.logger import setup_logger
+from reminder_tasks import dispatch_due_reminders, release_stale_processing_locks
+
+# Set up logging
+logger = setup_logger(__name__)
 
 
 def main() -> None:
@@ -19,20 +30,53 @@ def main() -> None:
     Initialize and run the Telegram bot.
     
     Sets up the bot application with the API token from config,
-    registers all command handlers, and starts polling for messages.
+    registers all command handlers, and starts receiving updates via
+    webhook when WEBHOOK_URL is set, falling back to long polling.
     """
-    # Initialize the Telegram bot application
-    application = ApplicationBuilder().token(API_KEY).build()
+    # Initialize the Telegram bot application around the shared bot
+    application = ApplicationBuilder().bot(get_bot()).build()
 
     # Add handlers
-    application.add_handler(start_handler)
-    application.add_handler(help_handler)
-    application.add_handler(set_reminder_handler)
-    application.add_handler(list_reminders_handler)
-    application.add_handler(clear_all_handler)
-
-    # Run the bot
-    application.run_polling()
+    for handler in ALL_HANDLERS:
+        application.add_handler(handler)
+
+    # Connect and build indexes now, before the event loop starts, so the
+    # blocking setup never runs inside the first handler call
+    get_db_manager()
+
+    # Send due reminders from this process instead of Celery when enabled
+    if RUN_REMINDERS_IN_PROCESS:
+        try:
+            released = release_stale_processing_locks()
+            if released > 0:
+                logger.warning(f"Cleaned up {released} stale processing locks on startup")
+        except Exception as e:
+            logger.error(f"Failed to cleanup stale processing locks: {e}")
+        application.job_queue.run_repeating(
+            dispatch_due_reminders, interval=REMINDER_CHECK_INTERVAL, first=0
+        )
+
+    # Run the bot behind a webhook when a public URL is configured,
+    # so Telegram pushes one POST per update instead of being polled
+    if WEBHOOK_URL:
+        application.run_webhook(
+            listen="0.0.0.0",
+            port=WEBHOOK_PORT,
+            webhook_url=WEBHOOK_URL,
+            secret_token=WEBHOOK_SECRET,
+            bootstrap_retries=-1,
+            allowed_updates=Update.ALL_TYPES,
+        )
+        return
+
+    # Otherwise use long polling so Telegram holds getUpdates open
+    # until updates arrive instead of answering short empty polls
+    application.run_polling(
+        poll_interval=0.0,
+        timeout=POLLING_TIMEOUT,
+        bootstrap_retries=-1,
+        allowed_updates=Update.ALL_TYPES,
+    )
 
 
 if __name__ == "__main__":
@@ -6,13 +6,12 @@ and defines scheduled tasks for checking and sending reminders.
 """
 
 from celery import Celery
-from celery.signals import worker_ready
-from reminder_tasks import send_due_reminders
+from celery.signals import worker_ready, worker_process_shutdown
+from reminder_tasks import send_due_reminders, release_stale_processing_locks, close_dispatch_loop
 from celery.schedules import crontab
 from datetime import timedelta
-from config import CELERY_BROKER_URL, CELERY_RESULT_BACKEND
-from utils.db import get_reminders_collection
-from utils.logger import setup_logger
+from config import CELERY_BROKER_URL, CELERY_RESULT_BACKEND, REMINDER_CHECK_INTERVAL
+from utils.logger import setup_logger, stop_log_listener
 
 logger = setup_logger(__name__)
 
@@ -32,17 +31,29 @@ def cleanup_stale_processing_locks(sender=None, **kwargs):
     are permanently locked due to a previous worker crash.
     """
     try:
-        collection = get_reminders_collection()
-        result = collection.update_many(
-            {"processing": True},
-            {"$set": {"processing": False}}
-        )
-        if result.modified_count > 0:
-            logger.warning(f"Cleaned up {result.modified_count} stale processing locks on worker startup")
+        released = release_stale_processing_locks()
+        if released > 0:
+            logger.warning(f"Cleaned up {released} stale processing locks on worker startup")
     except Exception as e:
         logger.error(f"Failed to cleanup stale processing locks: {e}")
 
 
+@worker_process_shutdown.connect
+def shutdown_dispatch_loop(sender=None, **kwargs):
+    """
+    Release the reminder dispatcher's event loop and HTTP pool.
+    
+    The loop is kept open across ticks so connections are reused; this
+    closes it when the worker process exits. Pool processes exit via
+    os._exit without running atexit, so queued log records are flushed
+    here as well.
+    """
+    try:
+        close_dispatch_loop()
+    finally:
+        stop_log_listener()
+
+
 @celery_app.task
 def check_reminders() -> None:
     """
@@ -58,6 +69,9 @@ celery_app.conf.beat_schedule = {
     "check-reminders-every-minute": {
         "task": "celery_worker.check_reminders",
         # "schedule": crontab(),  # every minute
-        "schedule": timedelta(seconds=10)
+        "schedule": timedelta(seconds=REMINDER_CHECK_INTERVAL)
     }
-}
\ No newline at end of file
+}
+
+# Rebuild the beat heap only when the schedule changes
+celery_app.conf.beat_scheduler = "utils.beat_scheduler:InvalidatingScheduler"
\ No newline at end of file
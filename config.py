@@ -13,6 +13,9 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
+# Snapshot of the environment, taken once after .env is loaded
+_ENV = dict(os.environ)
+
 
 class ConfigError(Exception):
     """Raised when configuration is invalid or missing."""
@@ -34,7 +37,7 @@ def get_env_var(key: str, required: bool = True, default: Optional[str] = None)
     Raises:
         ConfigError: If required variable is missing
     """
-    value = os.getenv(key, default)
+    value = _ENV.get(key, default)
     
     if required and not value:
         raise ConfigError(f"Required environment variable '{key}' is not set")
@@ -50,11 +53,7 @@ def validate_config() -> None:
         ConfigError: If any required configuration is missing
     """
     required_vars = ["API_KEY", "GROQ_API_KEY", "AUTHORIZED_USER_ID"]
-    missing_vars = []
-    
-    for var in required_vars:
-        if not os.getenv(var):
-            missing_vars.append(var)
+    missing_vars = [var for var in required_vars if not _ENV.get(var)]
     
     if missing_vars:
         error_msg = (
@@ -64,9 +63,17 @@ def validate_config() -> None:
             "- GROQ_API_KEY: Your Groq API key\n"
             "- AUTHORIZED_USER_ID: Your Telegram User ID\n"
             "- MONGO_URI: MongoDB connection string (optional, defaults to localhost)\n"
-            "- REDIS_URL: Redis connection URL (optional, defaults to redis://redis:6379/0)"
+            "- REDIS_URL: Redis connection URL (optional, defaults to redis://redis:6379/0)\n"
+            "- WEBHOOK_URL: Public HTTPS URL for webhook mode (optional, defaults to polling)"
         )
         raise ConfigError(error_msg)
+    
+    # Webhook requests are only authenticated by the secret token
+    if _ENV.get("WEBHOOK_URL") and not _ENV.get("WEBHOOK_SECRET"):
+        raise ConfigError(
+            "WEBHOOK_SECRET must be set when WEBHOOK_URL is set, "
+            "otherwise anyone who finds the URL can post forged updates"
+        )
 
 
 # Load and validate configuration
@@ -83,6 +90,16 @@ AUTHORIZED_USER_ID = int(get_env_var("AUTHORIZED_USER_ID"))
 MONGO_URI = get_env_var("MONGO_URI", required=False, default="mongodb://localhost:27017")
 REDIS_URL = get_env_var("REDIS_URL", required=False, default="redis://redis:6379/0")
 
+# Send due reminders from the bot process instead of the Celery worker
+RUN_REMINDERS_IN_PROCESS = get_env_var(
+    "RUN_REMINDERS_IN_PROCESS", required=False, default="false"
+).lower() in ("1", "true", "yes")
+
+# Webhook configuration (polling is used when WEBHOOK_URL is unset)
+WEBHOOK_URL = get_env_var("WEBHOOK_URL", required=False)
+WEBHOOK_SECRET = get_env_var("WEBHOOK_SECRET", required=False)
+WEBHOOK_PORT = int(get_env_var("PORT", required=False, default="8080"))
+
 # Database configuration
 DATABASE_NAME = "telegram"
 REMINDERS_COLLECTION = "reminders"
@@ -91,5 +108,30 @@ REMINDERS_COLLECTION = "reminders"
 CELERY_BROKER_URL = REDIS_URL
 CELERY_RESULT_BACKEND = REDIS_URL
 
+# Seconds between due-reminder checks
+REMINDER_CHECK_INTERVAL = 10
+
+# Maximum number of due reminders dispatched per scheduler tick
+MAX_REMINDERS_PER_TICK = 500
+
+# Maximum reminder sends in flight at once
+MAX_CONCURRENT_SENDS = 25
+
+# Maximum reminder sends started per second, kept under Telegram's ~30 msg/s limit
+MAX_SENDS_PER_SECOND = 25
+
 # Timezone settings
-DEFAULT_TIMEZONE = "Asia/Singapore"
\ No newline at end of file
+DEFAULT_TIMEZONE = "Asia/Singapore"
+
+# Telegram polling configuration
+# Long-poll timeout (seconds) that Telegram holds getUpdates open for
+POLLING_TIMEOUT = 30
+# HTTP read/write timeouts for getUpdates, must outlive the long-poll
+POLLING_READ_TIMEOUT = POLLING_TIMEOUT + 5
+POLLING_WRITE_TIMEOUT = POLLING_TIMEOUT + 5
+# Backoff between short-poll (timeout 0) getUpdates calls after consecutive empty polls (seconds)
+POLLING_BACKOFF_BASE = 0.05
+POLLING_MAX_BACKOFF = 5.0
+# Shared HTTP connection pool for Telegram API calls
+TELEGRAM_CONNECTION_POOL_SIZE = 32
+TELEGRAM_POOL_TIMEOUT = 10.0
\ No newline at end of file
@@ -0,0 +1,26 @@
+"""
+Telegram command handlers for NotiflyMeBot.
+
+Collects the preconfigured handler objects registered by bot.py. The
+submodules stay importable as handlers.<name>, since the handler objects
+are exported under a separate name rather than over the module names.
+"""
+
+from handlers import (
+    start_handler,
+    help_handler,
+    set_reminder_handler,
+    list_reminders_handler,
+    clear_all_handler,
+)
+
+# Handlers in the order bot.py registers them
+ALL_HANDLERS = (
+    start_handler.start_handler,
+    help_handler.help_handler,
+    set_reminder_handler.set_reminder_handler,
+    list_reminders_handler.list_reminders_handler,
+    clear_all_handler.clear_all_handler,
+)
+
+__all__ = ["ALL_HANDLERS"]
@@ -7,14 +7,15 @@ to delete all their reminders with confirmation.
 
 from telegram import Update
 from telegram.ext import ContextTypes, ConversationHandler, CommandHandler, MessageHandler, filters
-from utils.db import get_reminders_collection
-
-# Get the MongoDB collection
-collection = get_reminders_collection()
+from utils.db import get_async_reminders_collection
 
 # Conversation states
 CONFIRM_DELETE = 1
 
+# Accepted confirmation answers
+_YES = frozenset({"yes", "y"})
+_NO = frozenset({"no", "n"})
+
 
 async def clearall(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """
@@ -30,11 +31,13 @@ async def clearall(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     Returns:
         int: ConversationHandler.END to end the conversation
     """
-    if update.message.text.lower() == "yes":
+    answer = (update.message.text or "").strip().lower()
+    if answer in _YES:
         user_id = update.effective_user.id
-        result = collection.delete_many({"user_id": user_id})
+        collection = get_async_reminders_collection()
+        result = await collection.delete_many({"user_id": user_id})
         await update.message.reply_text(f"All your reminders cleared. Deleted {result.deleted_count} reminders.")
-    elif update.message.text.lower() == "no":
+    elif answer in _NO:
         await update.message.reply_text("Cancelled.")
     else:
         await update.message.reply_text("Invalid input. Please type 'yes' or 'no'.")
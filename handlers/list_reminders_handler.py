@@ -7,18 +7,28 @@ all upcoming reminders for the user.
 
 from telegram import Update
 from telegram.ext import ContextTypes, CommandHandler
-from telegram.helpers import escape_markdown
-from utils.db import get_reminders_collection
+from pymongo import ASCENDING
+from utils.db import get_async_reminders_collection
 from utils.validation import validate_user_id
 from utils.logger import setup_logger
 from utils.exceptions import ValidationError
-from zoneinfo import ZoneInfo
+from utils.time_converter import SGT, UTC, DAY_NAMES
 from datetime import datetime
 
 # Set up logging
 logger = setup_logger(__name__)
 
-collection = get_reminders_collection()
+# Maximum number of reminders listed per /listreminders
+MAX_LISTED_REMINDERS = 50
+
+# Telegram's maximum message length; lines that don't fit are summarised
+MAX_MESSAGE_LENGTH = 4096
+# Note appended when not every reminder is listed, and the room reserved for it
+_MORE_NOTE = "_…and more reminders not shown_"
+_MORE_NOTE_RESERVE = len(_MORE_NOTE) + 1
+
+# MarkdownV2 escape table, same characters as telegram.helpers.escape_markdown
+_MDV2_ESCAPE = str.maketrans({c: "\\" + c for c in r"\_*[]()~`>#+-=|{}.!"})
 
 from utils.auth import restricted
 
@@ -28,8 +38,9 @@ async def listreminders(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
     """
     Handle the /listreminders command.
     
-    Retrieves and displays all upcoming reminders for the user
-    in a formatted list with dates in Singapore timezone.
+    Retrieves and displays the user's upcoming reminders (earliest first,
+    at most MAX_LISTED_REMINDERS) in a formatted list with dates in
+    Singapore timezone.
     
     Args:
         update: Telegram update object
@@ -39,14 +50,25 @@ async def listreminders(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
         # Validate user ID
         user_id = validate_user_id(update.effective_user.id)
         
-        docs = list(collection.find({"user_id": user_id}))
-        
-        if not docs:
-            await update.message.reply_text("❗️ You have no upcoming reminders.")
-            return
-
+        # Only fetch unsent reminders and the fields we render, earliest first;
+        # one extra document tells us whether there are more than we list
+        collection = get_async_reminders_collection()
+        cursor = (
+            collection.find({"user_id": user_id, "sent": False}, {"reminder": 1, "reminder_date": 1})
+            .sort("reminder_date", ASCENDING)
+            .limit(MAX_LISTED_REMINDERS + 1)
+        )
+
+        found = False
+        truncated = False
         lines = []
-        for doc in docs:
+        fetched = 0
+        async for doc in cursor:
+            found = True
+            fetched += 1
+            if fetched > MAX_LISTED_REMINDERS:
+                truncated = True
+                break
             try:
                 reminder = doc.get("reminder", "<no text>")
 
@@ -54,34 +76,49 @@ async def listreminders(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
                 dt_utc_naive: datetime = doc["reminder_date"]
 
                 # 2. Label it as UTC, then convert to SGT
-                dt_utc = dt_utc_naive.replace(tzinfo=ZoneInfo("UTC"))
-                dt_sgt = dt_utc.astimezone(ZoneInfo("Asia/Singapore"))
-
-                # 3. Build date string as: Tuesday 16/5/2026, 6pm
-                day_name = dt_sgt.strftime("%A")
-                date_part = f"{dt_sgt.day}/{dt_sgt.month}/{dt_sgt.year}"
-                time_part = dt_sgt.strftime("%-I%p").lower()  # e.g. '6pm'
-                date_str = f"{day_name} {date_part}, {time_part}"
-
-                # 4. Escape only the reminder text
-                safe_reminder = escape_markdown(reminder, version=2)
-
-                # 5. Combine into a bullet line with em-dash
-                line = f"• *{safe_reminder}* — {date_str}"
-                lines.append(line)
+                dt_utc = dt_utc_naive.replace(tzinfo=UTC)
+                dt_sgt = dt_utc.astimezone(SGT)
+
+                # 3. Escape only the reminder text
+                safe_reminder = reminder.translate(_MDV2_ESCAPE)
+
+                # 4. Build a bullet line as: • *text* — Tuesday 16/5/2026, 6pm
+                hour = dt_sgt.hour % 12 or 12
+                ampm = "am" if dt_sgt.hour < 12 else "pm"
+                lines.append(
+                    f"• *{safe_reminder}* — {DAY_NAMES[dt_sgt.weekday()]} "
+                    f"{dt_sgt.day}/{dt_sgt.month}/{dt_sgt.year}, {hour}{ampm}"
+                )
                 
             except Exception as e:
                 logger.error(f"Error processing reminder document {doc.get('_id', 'unknown')}: {e}")
                 # Skip this reminder and continue with others
                 continue
 
+        if not found:
+            await update.message.reply_text("❗️ You have no upcoming reminders.")
+            return
+
         if not lines:
             await update.message.reply_text("❗️ No valid reminders found.")
             return
 
         header = "📋 *Your Upcoming Reminders*\n\n"
         footer = "\n\n_Use /cancel to stop reminders or /listreminders to refresh_"
-        message = header + "\n".join(lines) + footer
+
+        # Keep the reply within Telegram's message size limit
+        budget = MAX_MESSAGE_LENGTH - len(header) - len(footer) - _MORE_NOTE_RESERVE
+        shown = []
+        used = 0
+        for line in lines:
+            used += len(line) + 1
+            if used > budget:
+                break
+            shown.append(line)
+        if truncated or len(shown) < len(lines):
+            shown.append(_MORE_NOTE)
+
+        message = header + "\n".join(shown) + footer
 
         await update.message.reply_text(message, parse_mode="MarkdownV2")
         
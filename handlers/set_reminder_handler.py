@@ -5,27 +5,41 @@ This module handles the /setreminder command which allows users
 to create new reminders through a multi-step conversation.
 """
 
+import time
+from dataclasses import dataclass
+from typing import Dict
+from bson import ObjectId
 from telegram import Update
-from telegram.ext import ContextTypes, ConversationHandler, CommandHandler, MessageHandler, filters
-from utils.db import get_reminders_collection
+from telegram.ext import ContextTypes, ConversationHandler, CommandHandler, MessageHandler, TypeHandler, filters
+from utils.db import get_async_reminders_collection
 from utils.groq_dateparser import groq_dateparser
-from utils.time_converter import sgt_to_utc
+from utils.time_converter import SGT, DAY_NAMES, MONTH_NAMES, sgt_to_utc
 from utils.logger import setup_logger
 from utils.validation import validate_reminder_text, validate_date_input, validate_user_id, validate_username
 from utils.exceptions import ValidationError
 from datetime import datetime, timezone
-from zoneinfo import ZoneInfo
 
 # Set up logging
 logger = setup_logger(__name__)
 
-# Get the MongoDB collection
-collection = get_reminders_collection()
-
 # Define conversation states
 WAITING_FOR_REMINDER = 1
 WAITING_FOR_DATE = 2
 
+# Seconds after which an unfinished /setreminder is discarded
+PENDING_REMINDER_TTL = 3600
+
+
+@dataclass(slots=True)
+class Pending:
+    """Reminder text waiting for its date."""
+    reminder: str
+    created: float
+
+
+# Reminders in progress, keyed by Telegram user ID
+_pending: Dict[int, Pending] = {}
+
 from utils.auth import restricted
 
 
@@ -67,8 +81,8 @@ async def handle_reminder(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         # Validate and sanitize reminder text
         reminder = validate_reminder_text(update.message.text)
         
-        # Store the reminder
-        context.user_data["reminder"] = reminder
+        # Store the reminder until the date arrives
+        _pending[update.effective_user.id] = Pending(reminder, time.monotonic())
 
         # Ask for the date
         await update.message.reply_text("When should I remind you? Type /cancel to stop.")
@@ -97,13 +111,16 @@ async def handle_date(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int
     Returns:
         int: ConversationHandler.END or WAITING_FOR_DATE if validation fails
     """
+    pending = _pending.get(update.effective_user.id)
+    if pending is None or time.monotonic() - pending.created > PENDING_REMINDER_TTL:
+        _pending.pop(update.effective_user.id, None)
+        await update.message.reply_text("That reminder has expired. Please start again with /setreminder.")
+        return ConversationHandler.END
+
     try:
         # Validate and sanitize date input
         user_date = validate_date_input(update.message.text)
         
-        # Hardcoded timezone for all users
-        user_tz = "Asia/Singapore"
-
         # Parse user input and get the time in SGT (using AI async call)
         await update.message.reply_chat_action("typing")  # Show typing indicator
         parsed_time = await groq_dateparser(user_date)
@@ -116,23 +133,20 @@ async def handle_date(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int
         # Defensive check: ensure parsed_time has timezone info
         if parsed_time.tzinfo is None:
             logger.error(f"Parsed time missing tzinfo, defaulting to SGT")
-            parsed_time = parsed_time.replace(tzinfo=ZoneInfo(user_tz))
+            parsed_time = parsed_time.replace(tzinfo=SGT)
         
         # Check if date is in the past
-        # We compare against current time in the user's timezone
-        now_local = datetime.now(parsed_time.tzinfo)
-        if parsed_time <= now_local:
+        # Aware datetimes compare by instant, so one UTC clock read suffices
+        now_utc = datetime.now(timezone.utc)
+        if parsed_time <= now_utc:
             await update.message.reply_text("❌ The date must be in the future. Please enter a future date.")
             return WAITING_FOR_DATE
 
         # Convert local time to UTC for storage
         utc_time = sgt_to_utc(parsed_time)  # sgt_to_utc handles generic awareness
 
-        # Store the time
-        context.user_data["reminder_date"] = utc_time
-
         # Insert
-        return await handle_insert(update, context, parsed_time)
+        return await handle_insert(update, context, pending.reminder, utc_time, parsed_time)
         
     except ValidationError as e:
         await update.message.reply_text(f"❌ {str(e)} Please try again.")
@@ -143,7 +157,13 @@ async def handle_date(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int
         return WAITING_FOR_DATE
     
 # Insert reminder into the database
-async def handle_insert(update: Update, context: ContextTypes.DEFAULT_TYPE, parsed_time) -> int:
+async def handle_insert(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    reminder: str,
+    reminder_date: datetime,
+    parsed_time: datetime,
+) -> int:
     """
     Insert the validated reminder into the database.
     
@@ -153,33 +173,48 @@ async def handle_insert(update: Update, context: ContextTypes.DEFAULT_TYPE, pars
     Args:
         update: Telegram update object
         context: Telegram context object
+        reminder: Validated reminder text
+        reminder_date: Reminder time in UTC for storage
         parsed_time: Parsed reminder time in Singapore Time (SGT)
         
     Returns:
         int: ConversationHandler.END
     """
+    # The conversation ends here whatever the outcome
+    _pending.pop(update.effective_user.id, None)
+
     try:
-        # Get and validate the data items
-        reminder = context.user_data["reminder"]
-        reminder_date = context.user_data["reminder_date"]
-        
         # Validate user data
-        user_id = validate_user_id(update.message.from_user.id)
-        username = validate_username(update.message.from_user.username)
-
-        # Insert the reminder
-        collection.insert_one({
-            "user_id": user_id,
-            "username": username,
-            "reminder": reminder, 
-            "reminder_date": reminder_date,
-            "recurrence": "none",
-            "sent": False,
-            "created_at": datetime.now(timezone.utc),
-        })
+        user = update.message.from_user
+        user_id = validate_user_id(user.id)
+        username = validate_username(user.username)
+
+        # Insert the reminder, stamping created_at with the server's clock
+        # so timestamps agree across app replicas
+        collection = get_async_reminders_collection()
+        await collection.update_one(
+            {"_id": ObjectId()},
+            {
+                "$setOnInsert": {
+                    "user_id": user_id,
+                    "username": username,
+                    "reminder": reminder, 
+                    "reminder_date": reminder_date,
+                    "recurrence": "none",
+                    "sent": False,
+                },
+                "$currentDate": {"created_at": True},
+            },
+            upsert=True,
+        )
         
         # Confirm to user
-        formatted_time = parsed_time.strftime("%A, %B %d at %I:%M %p")
+        hour12 = parsed_time.hour % 12 or 12
+        ampm = "AM" if parsed_time.hour < 12 else "PM"
+        formatted_time = (
+            f"{DAY_NAMES[parsed_time.weekday()]}, {MONTH_NAMES[parsed_time.month - 1]} {parsed_time.day} "
+            f"at {hour12}:{parsed_time.minute:02d} {ampm}"
+        )
         message = f"Got it! Reminder set for {formatted_time}"
         await update.message.reply_text(message)
         logger.info(f"Successfully saved reminder for user {user_id}: {reminder}")
@@ -213,15 +248,30 @@ async def cancel(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     Returns:
         int: ConversationHandler.END
     """
+    _pending.pop(update.effective_user.id, None)
     await update.message.reply_text("Cancelled.")
     return ConversationHandler.END
 
+# Conversation timed out
+async def timeout(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """
+    Discard the pending reminder of a conversation that timed out.
+    
+    Args:
+        update: Last update received in the conversation
+        context: Telegram context object
+    """
+    if update.effective_user:
+        _pending.pop(update.effective_user.id, None)
+
 # Conversation handler for setting reminders
 set_reminder_handler = ConversationHandler(
     entry_points=[CommandHandler("setreminder", setreminder)],
     states={
         WAITING_FOR_REMINDER: [MessageHandler(filters.TEXT & ~filters.COMMAND, handle_reminder)],
         WAITING_FOR_DATE: [MessageHandler(filters.TEXT & ~filters.COMMAND, handle_date)],
+        ConversationHandler.TIMEOUT: [TypeHandler(Update, timeout)],
     },
     fallbacks=[CommandHandler("cancel", cancel)],
+    conversation_timeout=PENDING_REMINDER_TTL,
 )
\ No newline at end of file
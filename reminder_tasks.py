@@ -7,27 +7,32 @@ for due reminders and send them via Telegram.
 
 import asyncio
 from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from bson import ObjectId
 from telegram import Bot
 from telegram.error import TelegramError
-from config import API_KEY
-from utils.db import get_reminders_collection
+from telegram.ext import ContextTypes
+from pymongo import ASCENDING, UpdateMany
+from config import MAX_REMINDERS_PER_TICK, MAX_CONCURRENT_SENDS, MAX_SENDS_PER_SECOND
+from utils.db import get_reminders_collection, get_async_reminders_collection
 from utils.logger import setup_logger
+from utils.telegram_bot import get_bot
 from utils.exceptions import DatabaseError
 
 # Set up logging
 logger = setup_logger(__name__)
 
-# Get the MongoDB collection
-collection = get_reminders_collection()
+# Event loop reused across Celery ticks so the shared bot's HTTP connection pool
+# and the Motor client stay alive between runs
+_loop: Optional[asyncio.AbstractEventLoop] = None
 
-bot = Bot(token=API_KEY)
 
-
-async def _send_telegram_message(user_id: int, text: str) -> bool:
+async def _send_telegram_message(sender: Bot, user_id: int, text: str) -> bool:
     """
     Async helper to send a Telegram message.
     
     Args:
+        sender: Bot used to send the message
         user_id: Telegram user ID
         text: Message text
         
@@ -35,7 +40,7 @@ async def _send_telegram_message(user_id: int, text: str) -> bool:
         bool: True if sent successfully, False otherwise
     """
     try:
-        await bot.send_message(chat_id=user_id, text=f"🔔 Reminder: {text}")
+        await sender.send_message(chat_id=user_id, text=f"🔔 Reminder: {text}")
         return True
     except TelegramError as e:
         logger.error(f"Telegram API error sending to {user_id}: {e}")
@@ -45,74 +50,242 @@ async def _send_telegram_message(user_id: int, text: str) -> bool:
         return False
 
 
+async def _claim_due_reminders(now_utc: datetime, claim_id: ObjectId) -> List[Dict[str, Any]]:
+    """
+    Atomically claim up to MAX_REMINDERS_PER_TICK due reminders.
+    
+    Candidate reminders are locked with a single update_many that tags
+    them with the given claim ID. The update re-checks the due filter per
+    document, so concurrent workers never claim the same reminder.
+    
+    Args:
+        now_utc: Current time in UTC
+        claim_id: Fresh ID identifying this tick's claim
+        
+    Returns:
+        List[Dict[str, Any]]: Claimed reminder documents
+    """
+    collection = get_async_reminders_collection()
+    
+    # We look for documents that are due, not sent, and NOT currently processing
+    due_filter = {
+        "reminder_date": {"$lte": now_utc},
+        "sent": False,
+        "processing": {"$ne": True}  # Avoid double processing
+    }
+    cursor = (
+        collection.find(due_filter, {"_id": 1})
+        .sort("reminder_date", ASCENDING)
+        .limit(MAX_REMINDERS_PER_TICK)
+    )
+    candidate_ids = [doc["_id"] async for doc in cursor]
+    if not candidate_ids:
+        return []
+    
+    # Lock the candidates that are still unclaimed
+    await collection.update_many(
+        {**due_filter, "_id": {"$in": candidate_ids}},
+        {"$set": {"processing": True, "claim_id": claim_id}}
+    )
+    
+    # Only fetch the fields the sender needs
+    cursor = collection.find(
+        {"_id": {"$in": candidate_ids}, "claim_id": claim_id},
+        {"user_id": 1, "reminder": 1}
+    ).batch_size(200)
+    return [doc async for doc in cursor]
+
+
+async def _send_reminders(sender: Bot, reminders: List[Dict[str, Any]]) -> List[bool]:
+    """
+    Send the given reminders concurrently.
+    
+    Sends are started at most MAX_SENDS_PER_SECOND per second, with at
+    most MAX_CONCURRENT_SENDS messages in flight at once.
+    
+    Args:
+        sender: Bot used to send the messages
+        reminders: Claimed reminder documents
+        
+    Returns:
+        List[bool]: Per-reminder send result, in the same order
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    interval = 1 / MAX_SENDS_PER_SECOND
+    
+    async def _send_one(index: int, reminder: Dict[str, Any]) -> bool:
+        # Space out start times so bursts stay under Telegram's rate limit
+        delay = start + index * interval - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        async with semaphore:
+            return await _send_telegram_message(sender, reminder["user_id"], reminder["reminder"])
+    
+    return await asyncio.gather(*(_send_one(i, r) for i, r in enumerate(reminders)))
+
+
+async def _record_results(reminders: List[Dict[str, Any]], results: List[bool]) -> None:
+    """
+    Write send results back in a single bulk_write.
+    
+    Sent reminders are marked as sent; every claimed reminder is unlocked.
+    The bulk_write holds at most two operations, one per outcome, however
+    many reminders were sent.
+    
+    Args:
+        reminders: Claimed reminder documents
+        results: Per-reminder send result, in the same order
+    """
+    sent_ids: List[ObjectId] = []
+    failed_ids: List[ObjectId] = []
+    for reminder, success in zip(reminders, results):
+        if success:
+            sent_ids.append(reminder["_id"])
+            logger.info(f"Sent reminder: {reminder['reminder']} to User ID: {reminder['user_id']}")
+        else:
+            failed_ids.append(reminder["_id"])
+    
+    updates = []
+    if sent_ids:
+        # Mark as sent and release lock
+        updates.append(UpdateMany(
+            {"_id": {"$in": sent_ids}},
+            {"$set": {"sent": True, "processing": False}}
+        ))
+    if failed_ids:
+        # Internal failure (e.g. user blocked bot)
+        # We release the lock but DON'T mark as sent, so it might retry
+        updates.append(UpdateMany(
+            {"_id": {"$in": failed_ids}},
+            {"$set": {"processing": False}}
+        ))
+    
+    await get_async_reminders_collection().bulk_write(updates, ordered=False)
+
+
+async def _release_claim(claim_id: ObjectId) -> None:
+    """
+    Unlock every reminder of a claim that was not marked as sent.
+    
+    Args:
+        claim_id: ID of the claim to release
+    """
+    try:
+        await get_async_reminders_collection().update_many(
+            {"claim_id": claim_id, "sent": False},
+            {"$set": {"processing": False}}
+        )
+    except Exception as e:
+        logger.error(f"Failed to release claim {claim_id}: {e}")
+
+
+async def _dispatch_due_reminders(sender: Bot) -> None:
+    """
+    Claim, send and record all currently due reminders.
+    
+    Args:
+        sender: Bot used to send the messages
+    """
+    # No-op once initialized; needed so shutdown() later closes the pool
+    await sender.initialize()
+    
+    now_utc = datetime.now(timezone.utc)
+    claim_id = ObjectId()
+    
+    try:
+        reminders = await _claim_due_reminders(now_utc, claim_id)
+        if not reminders:
+            return
+        
+        results = await _send_reminders(sender, reminders)
+        await _record_results(reminders, results)
+    except Exception:
+        # Don't leave this tick's reminders locked until the next restart
+        await _release_claim(claim_id)
+        raise
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """
+    Returns this process's persistent event loop, creating it on first use.
+    
+    Created lazily so each forked Celery worker process gets its own loop.
+    """
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+    return _loop
+
+
+def close_dispatch_loop() -> None:
+    """
+    Shut down the bot's HTTP connection pool and close the persistent loop.
+    
+    Called when a Celery worker process exits.
+    """
+    global _loop
+    if _loop is None or _loop.is_closed():
+        return
+    try:
+        _loop.run_until_complete(get_bot().shutdown())
+    except Exception as e:
+        logger.error(f"Failed to shut down bot cleanly: {e}")
+    finally:
+        _loop.close()
+        _loop = None
+
+
+def release_stale_processing_locks() -> int:
+    """
+    Reset any reminders stuck in processing state from a crashed dispatcher.
+    
+    Returns:
+        int: Number of reminders unlocked
+    """
+    result = get_reminders_collection().update_many(
+        {"processing": True},
+        {"$set": {"processing": False}}
+    )
+    return result.modified_count
+
+
 def send_due_reminders() -> None:
     """
     Check for due reminders and send them via Telegram.
     
     Queries the database for reminders that are due (reminder_date <= now)
-    and haven't been sent yet. Uses atomic find_one_and_update to prevent
-    race conditions between multiple workers.
+    and haven't been sent yet, claiming them atomically to prevent race
+    conditions between multiple workers. At most MAX_REMINDERS_PER_TICK
+    reminders are processed per call; any remainder is picked up next tick.
+    
+    Claimed reminders are sent concurrently and their results are written
+    back in a single bulk_write.
     
     This function is called periodically by the Celery scheduler.
     """
     try:
-        now_utc = datetime.now(timezone.utc)
-        
-        # Process reminders one at a time with atomic updates to prevent race conditions
-        while True:
-            # Atomically find and claim a reminder
-            # We look for documents that are due, not sent, and NOT currently processing
-            reminder = collection.find_one_and_update(
-                {
-                    "reminder_date": {"$lte": now_utc},
-                    "sent": False,
-                    "processing": {"$ne": True}  # Avoid double processing
-                },
-                {
-                    "$set": {"processing": True}  # Lock it
-                },
-                return_document=True
-            )
-            
-            # If no more due reminders found, exit loop
-            if reminder is None:
-                break
-            
-            user_id = reminder["user_id"]
-            text = reminder["reminder"]
-            reminder_id = reminder["_id"]
-
-            try:
-                # Run the async send in a new event loop
-                # This is necessary because Celery runs these tasks synchronously
-                success = asyncio.run(_send_telegram_message(user_id, text))
-                
-                if success:
-                    # Mark as sent and release lock
-                    collection.update_one(
-                        {"_id": reminder_id}, 
-                        {"$set": {"sent": True, "processing": False}}
-                    )
-                    logger.info(f"Sent reminder: {text} to User ID: {user_id}")
-                else:
-                    # Internal failure (e.g. user blocked bot)
-                    # We release the lock but DON'T mark as sent, so it might retry
-                    # Or we could mark as 'failed' if we want to stop retrying.
-                    # For now, just release lock.
-                    collection.update_one(
-                        {"_id": reminder_id}, 
-                        {"$set": {"processing": False}}
-                    )
-                    
-            except Exception as e:
-                logger.error(f"Error processing individual reminder {reminder_id}: {e}")
-                # Release lock on error
-                collection.update_one(
-                    {"_id": reminder_id}, 
-                    {"$set": {"processing": False}}
-                )
+        # Celery runs tasks synchronously, so drive the async dispatch on a
+        # loop that is kept for the life of the worker process
+        _get_loop().run_until_complete(_dispatch_due_reminders(get_bot()))
                 
     except Exception as e:
         logger.error(f"Critical error in send_due_reminders: {e}")
         raise DatabaseError(f"Failed to check for due reminders: {e}")
 
+
+async def dispatch_due_reminders(context: ContextTypes.DEFAULT_TYPE) -> None:
+    """
+    Job-queue callback that sends due reminders from the bot process.
+    
+    Same work as send_due_reminders, but runs on the bot's event loop and
+    sends through the application's bot.
+    
+    Args:
+        context: Telegram context object for the job
+    """
+    try:
+        await _dispatch_due_reminders(context.bot)
+    except Exception as e:
+        logger.error(f"Critical error in dispatch_due_reminders: {e}")
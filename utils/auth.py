@@ -2,6 +2,8 @@
 Authentication utilities for NotiflyMeBot.
 """
 
+import time
+from collections import OrderedDict
 from functools import wraps
 from telegram import Update
 from telegram.ext import ContextTypes
@@ -10,14 +12,39 @@ from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Users allowed to use the bot
+AUTHORIZED_IDS = frozenset({AUTHORIZED_USER_ID})
+
+# Minimum seconds between replies to the same unauthorized user
+UNAUTHORIZED_REPLY_INTERVAL = 60
+
+# Last time (monotonic) each unauthorized user was sent a reply, oldest first
+_last_unauthorized_reply: "OrderedDict[int, float]" = OrderedDict()
+
+
+def _prune_unauthorized_replies(now: float) -> None:
+    """Forget users whose last reply is older than UNAUTHORIZED_REPLY_INTERVAL."""
+    while _last_unauthorized_reply:
+        user_id, last_reply = next(iter(_last_unauthorized_reply.items()))
+        if now - last_reply <= UNAUTHORIZED_REPLY_INTERVAL:
+            break
+        del _last_unauthorized_reply[user_id]
+
+
 def restricted(func):
     """Decorator to restrict access to the authorized user only."""
     @wraps(func)
     async def wrapped(update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs):
         user_id = update.effective_user.id
-        if user_id != AUTHORIZED_USER_ID:
+        if user_id not in AUTHORIZED_IDS:
             logger.warning(f"Unauthorized access attempt by user {user_id}")
-            await update.message.reply_text("You are not authorised to use this bot.")
+            # Reply at most once per interval so repeated attempts can't
+            # tie up Telegram API calls; otherwise drop silently
+            now = time.monotonic()
+            _prune_unauthorized_replies(now)
+            if user_id not in _last_unauthorized_reply:
+                _last_unauthorized_reply[user_id] = now
+                await update.message.reply_text("You are not authorised to use this bot.")
             return
         return await func(update, context, *args, **kwargs)
     return wrapped
@@ -0,0 +1,59 @@
+"""
+Celery beat scheduler for NotiflyMeBot.
+
+This module provides a beat scheduler that only rebuilds its heap when
+the schedule is explicitly changed, instead of comparing every entry
+on every tick.
+"""
+
+from typing import Any, Dict
+from celery.beat import PersistentScheduler
+
+
+class InvalidatingScheduler(PersistentScheduler):
+    """
+    PersistentScheduler with explicit heap invalidation.
+
+    The stock scheduler calls schedules_equal() on every tick, which walks
+    all entries (O(n)) to detect changes. Here every mutation of the
+    schedule sets a flag instead, so ticks between changes only pop and
+    push the heap (O(log n)).
+    """
+
+    _heap_invalidated: bool = True
+
+    def invalidate(self) -> None:
+        """Force the heap to be rebuilt on the next tick."""
+        self._heap_invalidated = True
+
+    def schedules_equal(self, old_schedules: Dict[str, Any], new_schedules: Dict[str, Any]) -> bool:
+        """
+        Report whether the schedule changed since the heap was last built.
+
+        Consumes the invalidation flag so the heap is rebuilt only once
+        per change.
+        """
+        if self._heap_invalidated:
+            self._heap_invalidated = False
+            return False
+        return True
+
+    def add(self, **kwargs: Any) -> Any:
+        entry = super().add(**kwargs)
+        self.invalidate()
+        return entry
+
+    def update_from_dict(self, dict_: Dict[str, Any]) -> None:
+        super().update_from_dict(dict_)
+        self.invalidate()
+
+    def merge_inplace(self, b: Dict[str, Any]) -> None:
+        super().merge_inplace(b)
+        self.invalidate()
+
+    def set_schedule(self, schedule: Dict[str, Any]) -> None:
+        super().set_schedule(schedule)
+        self.invalidate()
+
+    # Rebind the property so assignments go through the invalidating setter
+    schedule = property(PersistentScheduler.get_schedule, set_schedule)
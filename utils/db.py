@@ -5,17 +5,38 @@ This module provides a centralized database connection manager
 with connection pooling and reuse capabilities.
 """
 
+from functools import cache
 from typing import Optional
 from datetime import datetime, timezone
-from pymongo import MongoClient
+from pymongo import ASCENDING, MongoClient
 from pymongo.database import Database
 from pymongo.collection import Collection
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection, AsyncIOMotorDatabase
 from config import MONGO_URI, DATABASE_NAME, REMINDERS_COLLECTION
 from utils.logger import setup_logger
 
 # Set up logging
 logger = setup_logger(__name__)
 
+# Names of the indexes created by DatabaseManager
+PROCESSING_LOCK_INDEX = "proc_locked"
+DUE_REMINDERS_INDEX = "due_reminders_idx"
+USER_REMINDERS_INDEX = "user_id_1_reminder_date_1"
+
+# Client options shared by the sync and async clients: a warm, larger
+# connection pool, wire compression (zstd when installed, else zlib) and
+# bounded timeouts so a lost server fails fast instead of hanging
+MONGO_CLIENT_OPTIONS = {
+    "maxPoolSize": 50,
+    "minPoolSize": 5,
+    "maxIdleTimeMS": 60000,
+    "compressors": "zstd,zlib",
+    "retryWrites": True,
+    "w": 1,
+    "socketTimeoutMS": 20000,
+    "serverSelectionTimeoutMS": 5000,
+}
+
 
 class DatabaseManager:
     """
@@ -23,23 +44,65 @@ class DatabaseManager:
     
     Manages MongoDB connections with connection pooling and reuse.
     Ensures only one client instance is created per application.
+    
+    A synchronous PyMongo client serves the Celery worker, while an
+    asynchronous Motor client is created on first use for the Telegram
+    handlers so database calls don't block the event loop.
     """
     
     _instance: Optional['DatabaseManager'] = None
     _client: Optional[MongoClient] = None
     _database: Optional[Database] = None
+    _async_client: Optional[AsyncIOMotorClient] = None
+    _async_database: Optional[AsyncIOMotorDatabase] = None
     
     def __new__(cls) -> 'DatabaseManager':
+        # Connect only when the singleton is first created; later calls
+        # return the existing instance without re-running any setup
         if cls._instance is None:
-            cls._instance = super(DatabaseManager, cls).__new__(cls)
-        return cls._instance
-    
-    def __init__(self) -> None:
-        if self._client is None:
+            instance = super(DatabaseManager, cls).__new__(cls)
             logger.info(f"Connecting to MongoDB at {MONGO_URI}")
-            self._client = MongoClient(MONGO_URI)
-            self._database = self._client[DATABASE_NAME]
+            instance._client = MongoClient(MONGO_URI, **MONGO_CLIENT_OPTIONS)
+            instance._database = instance._client[DATABASE_NAME]
             logger.info(f"Connected to database: {DATABASE_NAME}")
+            instance._ensure_indexes()
+            cls._instance = instance
+        return cls._instance
+    
+    def _ensure_indexes(self) -> None:
+        """
+        Create the indexes used by reminder queries if they don't exist.
+        
+        Each index is created independently, so one failure doesn't stop
+        the others. Queries don't hint these indexes and keep working
+        (more slowly) if any are missing.
+        """
+        reminders = self._database[REMINDERS_COLLECTION]
+        indexes = [
+            # Only locked reminders are indexed, so unlocking stale locks
+            # touches O(locked) entries instead of scanning the collection
+            (
+                [("processing", ASCENDING)],
+                {"partialFilterExpression": {"processing": True}, "name": PROCESSING_LOCK_INDEX},
+            ),
+            # Serves the due-reminder range scan run on every scheduler tick.
+            # Only unsent reminders are indexed, so the index stays small as
+            # sent reminders accumulate
+            (
+                [("sent", ASCENDING), ("reminder_date", ASCENDING)],
+                {"partialFilterExpression": {"sent": False}, "name": DUE_REMINDERS_INDEX},
+            ),
+            # Serves per-user listing sorted by date
+            (
+                [("user_id", ASCENDING), ("reminder_date", ASCENDING)],
+                {"name": USER_REMINDERS_INDEX},
+            ),
+        ]
+        for keys, options in indexes:
+            try:
+                reminders.create_index(keys, **options)
+            except Exception as e:
+                logger.error(f"Failed to create index {options['name']}: {e}")
     
     @property
     def database(self) -> Database:
@@ -53,17 +116,53 @@ class DatabaseManager:
         """Get the reminders collection."""
         return self.database[REMINDERS_COLLECTION]
     
+    @property
+    def async_database(self) -> AsyncIOMotorDatabase:
+        """Get the async database instance, connecting on first use."""
+        if self._async_database is None:
+            self._async_client = AsyncIOMotorClient(MONGO_URI, **MONGO_CLIENT_OPTIONS)
+            self._async_database = self._async_client[DATABASE_NAME]
+            logger.info(f"Connected async client to database: {DATABASE_NAME}")
+        return self._async_database
+    
+    @property
+    def async_reminders_collection(self) -> AsyncIOMotorCollection:
+        """Get the async reminders collection."""
+        return self.async_database[REMINDERS_COLLECTION]
+    
     def close(self) -> None:
-        """Close the database connection."""
+        """Close the database connections."""
         if self._client:
             self._client.close()
             logger.info("Database connection closed")
             self._client = None
             self._database = None
+            # Let the next DatabaseManager() reconnect
+            type(self)._instance = None
+        if self._async_client:
+            self._async_client.close()
+            logger.info("Async database connection closed")
+            self._async_client = None
+            self._async_database = None
+        
+        # Drop the cached manager and collections so the next getter call reconnects
+        get_db_manager.cache_clear()
+        get_reminders_collection.cache_clear()
+        get_async_reminders_collection.cache_clear()
 
 
-# Global database manager instance
-db_manager = DatabaseManager()
+@cache
+def get_db_manager() -> DatabaseManager:
+    """
+    Returns the database manager, connecting on first use.
+    
+    Nothing connects at import time, so importing a module that uses
+    the database is free until a query is actually made.
+    
+    Returns:
+        DatabaseManager: The singleton database manager
+    """
+    return DatabaseManager()
 
 
 def get_database() -> Database:
@@ -75,9 +174,10 @@ def get_database() -> Database:
     Returns:
         Database: MongoDB database instance
     """
-    return db_manager.database
+    return get_db_manager().database
 
 
+@cache
 def get_reminders_collection() -> Collection:
     """
     Returns the reminders collection.
@@ -85,7 +185,18 @@ def get_reminders_collection() -> Collection:
     Returns:
         Collection: MongoDB reminders collection
     """
-    return db_manager.reminders_collection
+    return get_db_manager().reminders_collection
+
+
+@cache
+def get_async_reminders_collection() -> AsyncIOMotorCollection:
+    """
+    Returns the reminders collection for use from async code.
+    
+    Returns:
+        AsyncIOMotorCollection: Motor reminders collection
+    """
+    return get_db_manager().async_reminders_collection
 
 # Optional: Test connection when the script runs
 if __name__ == "__main__":
@@ -6,20 +6,76 @@ expressions into datetime objects using Groq's Structured Outputs (JSON Schema).
 """
 
 import asyncio
-import json
-from typing import Optional
+import re
+import httpx
+from collections import OrderedDict
+from functools import cache
+from typing import Optional, Tuple
 from config import GROQ_API_KEY
-from groq import Groq
+from groq import AsyncGroq
 from pydantic import BaseModel, Field
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from utils.logger import setup_logger
 from utils.exceptions import DateParsingError
 from utils.validation import sanitize_for_llm
-from zoneinfo import ZoneInfo
+from utils.time_converter import SGT
 
 # Set up logging
 logger = setup_logger(__name__)
 
+# Maximum number of concurrent outbound Groq calls
+MAX_CONCURRENT_PARSES = 10
+# Number of parsed inputs kept in the response cache
+PARSE_CACHE_SIZE = 4096
+# Upper bound (seconds) on a single Groq request
+GROQ_REQUEST_TIMEOUT = 15
+# Seconds an idle Groq connection is kept open for reuse
+GROQ_KEEPALIVE_EXPIRY = 120
+
+_parse_semaphore = asyncio.Semaphore(MAX_CONCURRENT_PARSES)
+
+# LRU response cache keyed on (normalized input, time bucket)
+_parse_cache: "OrderedDict[Tuple[str, str], datetime]" = OrderedDict()
+
+# Inputs whose meaning shifts minute to minute ("in 2 hours", "same time tomorrow")
+RELATIVE_TIME_PATTERN = re.compile(
+    r'\b(in|after|within|later|ago|now|soon|half|quarter|same\s+time|this\s+time'
+    r'|secs?|seconds?|mins?|minutes?|hrs?|hours?)\b'
+    r'|\d+\s*(s|m|h)\b',
+    re.IGNORECASE,
+)
+
+# Inputs naming an explicit clock time or calendar date ("9am", "21:30", "dec 25")
+ABSOLUTE_TIME_PATTERN = re.compile(
+    r'\b\d{1,2}(:\d{2})?\s*(am|pm)\b|\b\d{1,2}:\d{2}\b|\b(noon|midnight)\b'
+    r'|\b\d{1,2}[/-]\d{1,2}\b|\b\d{4}-\d{2}-\d{2}\b'
+    r'|\b(jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\b',
+    re.IGNORECASE,
+)
+
+# Inputs simple enough to resolve locally without calling Groq
+SIMPLE_OFFSET_PATTERN = re.compile(
+    r'^in\s+(\d{1,4})\s*(m|mins?|minutes?|h|hrs?|hours?|d|days?|w|weeks?)$'
+)
+ISO_DATETIME_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}[ t]\d{2}:\d{2}(:\d{2})?$')
+
+# timedelta keyword for each unit's first letter
+_OFFSET_UNITS = {"m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+
+# System prompt, identical on every call so the provider can reuse its cached prefix
+_SYS_PROMPT_TMPL = (
+    "You are a precise date and time parser. "
+    "Convert the user's natural language date expression into an absolute ISO-8601 datetime string. "
+    "The result must be in the {tz} timezone. "
+    "If the input is ambiguous, assume the most likely upcoming future date. "
+    "If the input cannot be parsed or refers to the past, set 'valid' to false. "
+    "Output MUST follow the provided JSON schema."
+)
+_SYS_PROMPT = _SYS_PROMPT_TMPL.format(tz="Asia/Singapore")
+
+# Per-call context, sent after the static prompt
+_NOW_PROMPT_TMPL = "Current time: {now} ({tz})."
+
 
 class ParsedDate(BaseModel):
     """Schema for structured date parsing response."""
@@ -29,10 +85,33 @@ class ParsedDate(BaseModel):
     valid: bool = Field(..., description="Whether the input was successfully parsed into a future date")
 
 
+# JSON schema sent as the structured output format, built once
+_PARSED_DATE_JSON_SCHEMA = ParsedDate.model_json_schema()
+
+
+@cache
+def _get_groq_client() -> AsyncGroq:
+    """
+    Returns the process-wide async Groq client, creating it on first use.
+    
+    The client keeps its HTTPS connections alive between calls and runs
+    on the bot's event loop. Its pool holds one connection per concurrent
+    parse, kept open long enough to span gaps between user messages.
+    """
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=MAX_CONCURRENT_PARSES,
+            max_keepalive_connections=MAX_CONCURRENT_PARSES,
+            keepalive_expiry=GROQ_KEEPALIVE_EXPIRY,
+        ),
+        timeout=GROQ_REQUEST_TIMEOUT,
+    )
+    return AsyncGroq(api_key=GROQ_API_KEY, http_client=http_client)
+
+
 async def groq_dateparser(user_input: str) -> Optional[datetime]:
     """
     Parse natural language date/time expressions into datetime objects.
-    Async wrapper to avoid blocking the event loop.
     
     Args:
         user_input: Natural language date/time expression
@@ -54,8 +133,18 @@ async def groq_dateparser(user_input: str) -> Optional[datetime]:
             
         logger.debug(f"Parsing date input: '{safe_input}' (TZ: Asia/Singapore)")
         
-        # Run the blocking Groq call in a thread pool
-        return await asyncio.to_thread(_sync_groq_call, safe_input)
+        # Normalize so repeats like "Tomorrow 3pm " hit the cache
+        normalized_input = safe_input.strip().lower()
+        
+        # Resolve trivial inputs locally, skipping the network round trip
+        local_result = _fast_local_parse(normalized_input)
+        if local_result is not None:
+            logger.debug(f"Parsed '{normalized_input}' locally to {local_result}")
+            return local_result
+        
+        # Call Groq on the event loop, bounding concurrency
+        async with _parse_semaphore:
+            return await _cached_parse(normalized_input)
             
     except DateParsingError:
         raise
@@ -64,54 +153,122 @@ async def groq_dateparser(user_input: str) -> Optional[datetime]:
         raise DateParsingError(f"Unexpected error during date parsing: {e}")
 
 
-def _sync_groq_call(user_input: str) -> Optional[datetime]:
+def _fast_local_parse(normalized_input: str) -> Optional[datetime]:
+    """
+    Parse "in N minutes/hours/days/weeks" and ISO datetimes without Groq.
+    
+    Args:
+        normalized_input: Sanitized, lowercased user input
+        
+    Returns:
+        datetime: Parsed datetime in SGT timezone, or None to fall back to Groq
+    """
+    match = SIMPLE_OFFSET_PATTERN.match(normalized_input)
+    if match:
+        amount, unit = match.groups()
+        return datetime.now(SGT) + timedelta(**{_OFFSET_UNITS[unit[0]]: int(amount)})
+    
+    if ISO_DATETIME_PATTERN.match(normalized_input):
+        try:
+            return datetime.fromisoformat(normalized_input).replace(tzinfo=SGT)
+        except ValueError:
+            return None
+    
+    return None
+
+
+async def _cached_parse(normalized_input: str) -> Optional[datetime]:
+    """
+    Parse normalized input through the response cache.
+    
+    Inputs are cached per minute by default. Only inputs naming an
+    explicit clock time or date ("tomorrow 9am", "friday 3pm") with no
+    relative wording are cached per SGT day; if such a cached answer has
+    already passed (e.g. "9am" asked again after 9am), the input is
+    re-parsed with a per-minute key instead.
+    """
+    now_utc = datetime.now(timezone.utc)
+    minute_bucket = f"minute:{int(now_utc.timestamp() // 60)}"
+    
+    if (
+        RELATIVE_TIME_PATTERN.search(normalized_input)
+        or not ABSOLUTE_TIME_PATTERN.search(normalized_input)
+    ):
+        return await _cached_groq_call(normalized_input, minute_bucket)
+    
+    day_bucket = f"day:{now_utc.astimezone(SGT).date().isoformat()}"
+    result = await _cached_groq_call(normalized_input, day_bucket)
+    if result is not None and result <= now_utc:
+        return await _cached_groq_call(normalized_input, minute_bucket)
+    return result
+
+
+async def _cached_groq_call(normalized_input: str, cache_bucket: str) -> Optional[datetime]:
+    """
+    Memoized _groq_call keyed on normalized input and a time bucket.
+    
+    Only successful parses are cached. Failures (None, e.g. a one-off
+    "valid": false answer) and errors are retried on the next call.
+    """
+    key = (normalized_input, cache_bucket)
+    cached = _parse_cache.get(key)
+    if cached is not None:
+        _parse_cache.move_to_end(key)
+        return cached
+    
+    result = await _groq_call(normalized_input)
+    if result is not None:
+        _parse_cache[key] = result
+        if len(_parse_cache) > PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+    return result
+
+
+async def _groq_call(user_input: str) -> Optional[datetime]:
     """
-    Synchronous helper that makes the actual Groq API call with structured output.
+    Make the actual Groq API call with structured output.
     """
     user_timezone = "Asia/Singapore"
     try:
         # Define current time in user's timezone
         now_utc = datetime.now(timezone.utc)
-        now_user = now_utc.astimezone(ZoneInfo(user_timezone))
+        now_user = now_utc.astimezone(SGT)
 
-        # Initialize Groq client
+        # Get the shared Groq client
         try:
-            client = Groq(api_key=GROQ_API_KEY)
+            client = _get_groq_client()
         except Exception as e:
             logger.error(f"Failed to initialize Groq client: {e}")
             raise DateParsingError(f"Failed to initialize AI client: {e}")
 
-        # Build the system prompt
-        system_prompt = (
-            f"You are a precise date and time parser. Current time: {now_user} ({user_timezone}). "
-            "Convert the user's natural language date expression into an absolute ISO-8601 datetime string. "
-            f"The result must be in the {user_timezone} timezone. "
-            "If the input is ambiguous, assume the most likely upcoming future date. "
-            "If the input cannot be parsed or refers to the past, set 'valid' to false. "
-            "Output MUST follow the provided JSON schema."
-        )
+        # Only the current time changes between calls
+        now_prompt = _NOW_PROMPT_TMPL.format(now=now_user, tz=user_timezone)
 
         # Make the Groq API call with structured output
         try:
             # Using kimi as in the user's example, as it supports structured outputs well
-            response = client.chat.completions.create(
-                model="openai/gpt-oss-20b",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_input},
-                ],
-                response_format={
-                    "type": "json_schema",
-                    "json_schema": {
-                        "name": "date_parsing_result",
-                        "schema": ParsedDate.model_json_schema(),
+            response = await asyncio.wait_for(
+                client.chat.completions.create(
+                    model="openai/gpt-oss-20b",
+                    messages=[
+                        {"role": "system", "content": _SYS_PROMPT},
+                        {"role": "system", "content": now_prompt},
+                        {"role": "user", "content": user_input},
+                    ],
+                    response_format={
+                        "type": "json_schema",
+                        "json_schema": {
+                            "name": "date_parsing_result",
+                            "schema": _PARSED_DATE_JSON_SCHEMA,
+                        },
                     },
-                },
+                ),
+                timeout=GROQ_REQUEST_TIMEOUT,
             )
             
             # Parse the response content
             content = response.choices[0].message.content
-            parsed_data = ParsedDate.model_validate(json.loads(content))
+            parsed_data = ParsedDate.model_validate_json(content)
             
         except Exception as e:
             logger.error(f"Groq API call or validation failed: {e}")
@@ -129,10 +286,10 @@ def _sync_groq_call(user_input: str) -> Optional[datetime]:
             
             # Ensure it's timezone-aware
             if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=ZoneInfo(user_timezone))
-            else:
-                # Ensure it matches the requested timezone
-                dt = dt.astimezone(ZoneInfo(user_timezone))
+                dt = dt.replace(tzinfo=SGT)
+            elif dt.utcoffset() != SGT.utcoffset(dt):
+                # Only convert when the offset differs from the requested timezone
+                dt = dt.astimezone(SGT)
             
             logger.debug(f"Successfully parsed '{user_input}' to {dt}")
             return dt
@@ -144,5 +301,5 @@ def _sync_groq_call(user_input: str) -> Optional[datetime]:
     except DateParsingError:
         raise
     except Exception as e:
-        logger.error(f"Error in _sync_groq_call: {e}")
+        logger.error(f"Error in _groq_call: {e}")
         return None
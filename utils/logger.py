@@ -5,11 +5,66 @@ This module provides a centralized logging configuration that can be
 used throughout the application for consistent log formatting and handling.
 """
 
+import atexit
 import logging
+import os
+import queue
 import sys
-from typing import Optional
+from functools import cache
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Optional
 
+# Records are queued by the calling thread and written to stdout by a
+# background listener thread, so logging never blocks on console I/O
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_console_handler = logging.StreamHandler(sys.stdout)
+_listener = QueueListener(_log_queue, _console_handler)
+_listener.start()
+_listener_running = True
 
+# Queue handlers handed out by setup_logger, repointed after a fork
+_queue_handlers: List[QueueHandler] = []
+
+
+def stop_log_listener() -> None:
+    """
+    Flush queued records and stop the current listener thread.
+    
+    Runs at exit, but processes that leave through os._exit (e.g. Celery
+    pool children) skip atexit and must call this themselves. Safe to
+    call more than once.
+    """
+    global _listener_running
+    if _listener_running:
+        _listener_running = False
+        _listener.stop()
+
+
+def _restart_listener_in_child() -> None:
+    """
+    Give a forked child its own queue and listener thread.
+    
+    The child inherits a copy of the parent's queue, whose pending records
+    the parent still writes itself; draining that copy would print them
+    twice, so it is abandoned.
+    """
+    global _log_queue, _listener, _listener_running
+    _log_queue = queue.SimpleQueue()
+    for handler in _queue_handlers:
+        handler.queue = _log_queue
+    _listener = QueueListener(_log_queue, _console_handler)
+    _listener.start()
+    _listener_running = True
+
+
+atexit.register(stop_log_listener)
+
+# Forked children (e.g. Celery pool workers) don't inherit the thread
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_listener_in_child)
+
+
+@cache
 def setup_logger(
     name: str,
     level: str = "INFO",
@@ -18,6 +73,10 @@ def setup_logger(
     """
     Set up a logger with consistent formatting.
     
+    Output is handed to a background thread through a queue, so callers
+    never wait on stdout. Results are cached, so repeat calls for the
+    same name return the configured logger immediately.
+    
     Args:
         name: Logger name (usually __name__)
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -37,11 +96,12 @@ def setup_logger(
     if logger.handlers:
         return logger
     
-    logger.setLevel(getattr(logging, level.upper()))
+    log_level = getattr(logging, level.upper())
+    logger.setLevel(log_level)
     
-    # Create console handler
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setLevel(getattr(logging, level.upper()))
+    # Create queue handler; it formats the record before enqueueing it
+    handler = QueueHandler(_log_queue)
+    handler.setLevel(log_level)
     
     # Create formatter and add it to the handler
     formatter = logging.Formatter(format_string)
@@ -49,6 +109,7 @@ def setup_logger(
     
     # Add the handler to the logger
     logger.addHandler(handler)
+    _queue_handlers.append(handler)
     
     return logger
 
@@ -0,0 +1,65 @@
+"""
+Polling utilities for NotiflyMeBot.
+
+This module provides a Telegram bot subclass that backs off between
+short-poll getUpdates calls while the bot is idle.
+"""
+
+import asyncio
+from typing import Any, Tuple
+from telegram import Update
+from telegram.ext import ExtBot
+from config import POLLING_BACKOFF_BASE, POLLING_MAX_BACKOFF
+from utils.logger import setup_logger
+
+# Set up logging
+logger = setup_logger(__name__)
+
+
+class BackoffBot(ExtBot):
+    """
+    ExtBot with bounded exponential backoff on empty getUpdates responses.
+
+    Each consecutive empty poll doubles the delay before the next one,
+    starting at POLLING_BACKOFF_BASE and capped at POLLING_MAX_BACKOFF.
+    The delay resets to zero as soon as any update is received.
+
+    Only short polls (timeout 0) are delayed. An empty long poll has
+    already waited the full timeout server-side, so sleeping afterwards
+    would save few requests while holding back new messages.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._consecutive_empty_polls = 0
+
+    @property
+    def backoff_delay(self) -> float:
+        """Get the delay (in seconds) to wait before the next poll."""
+        if self._consecutive_empty_polls == 0:
+            return 0.0
+        return min(
+            POLLING_MAX_BACKOFF,
+            POLLING_BACKOFF_BASE * 2 ** (self._consecutive_empty_polls - 1),
+        )
+
+    async def get_updates(self, *args: Any, **kwargs: Any) -> Tuple[Update, ...]:
+        """
+        Fetch updates, sleeping first if previous short polls came back empty.
+
+        Returns:
+            Tuple[Update, ...]: The updates returned by Telegram
+        """
+        delay = self.backoff_delay
+        if delay and not kwargs.get("timeout"):
+            await asyncio.sleep(delay)
+
+        updates = await super().get_updates(*args, **kwargs)
+
+        if updates:
+            self._consecutive_empty_polls = 0
+        else:
+            self._consecutive_empty_polls += 1
+            logger.debug(f"Empty poll #{self._consecutive_empty_polls}, next delay {self.backoff_delay:.2f}s")
+
+        return updates
@@ -0,0 +1,40 @@
+"""
+Shared Telegram bot instance for NotiflyMeBot.
+
+This module provides a single lazily created bot per process so that
+the application and the reminder dispatcher share one HTTP connection
+pool.
+"""
+
+from functools import cache
+from telegram.request import HTTPXRequest
+from config import (
+    API_KEY,
+    POLLING_READ_TIMEOUT,
+    POLLING_WRITE_TIMEOUT,
+    TELEGRAM_CONNECTION_POOL_SIZE,
+    TELEGRAM_POOL_TIMEOUT,
+)
+from utils.polling import BackoffBot
+
+
+@cache
+def get_bot() -> BackoffBot:
+    """
+    Returns the process-wide Telegram bot, creating it on first use.
+
+    Returns:
+        BackoffBot: Bot with a pooled request for API calls and a separate
+        long-poll request for getUpdates
+    """
+    return BackoffBot(
+        token=API_KEY,
+        request=HTTPXRequest(
+            connection_pool_size=TELEGRAM_CONNECTION_POOL_SIZE,
+            pool_timeout=TELEGRAM_POOL_TIMEOUT,
+        ),
+        get_updates_request=HTTPXRequest(
+            read_timeout=POLLING_READ_TIMEOUT,
+            write_timeout=POLLING_WRITE_TIMEOUT,
+        ),
+    )
@@ -8,6 +8,17 @@ and Coordinated Universal Time (UTC).
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
+SGT = ZoneInfo("Asia/Singapore")
+UTC = ZoneInfo("UTC")
+
+# Names indexed by datetime.weekday() and datetime.month - 1, used to
+# format dates without locale-dependent strftime
+DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+MONTH_NAMES = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
 
 def sgt_to_utc(time: datetime) -> datetime:
     """
@@ -19,7 +30,7 @@ def sgt_to_utc(time: datetime) -> datetime:
     Returns:
         datetime: The equivalent time in UTC timezone
     """
-    return time.astimezone(ZoneInfo("UTC"))
+    return time.astimezone(UTC)
 
 
 def utc_to_sgt(time: datetime) -> datetime:
@@ -32,4 +43,4 @@ def utc_to_sgt(time: datetime) -> datetime:
     Returns:
         datetime: The equivalent time in Singapore timezone
     """
-    return time.astimezone(ZoneInfo("Asia/Singapore"))
\ No newline at end of file
+    return time.astimezone(SGT)
\ No newline at end of file
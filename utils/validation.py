@@ -6,7 +6,8 @@ to prevent security issues and ensure data integrity.
 """
 
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 from utils.logger import setup_logger
 from utils.exceptions import ValidationError
 
@@ -20,13 +21,14 @@ MIN_REMINDER_LENGTH = 1
 
 # Patterns for validation
 SAFE_TEXT_PATTERN = re.compile(r'^[a-zA-Z0-9\s\.,!?\'"()-:;/@#$%&*+=_\[\]{}|\\`~\n\r]+$')
-SUSPICIOUS_PATTERNS = [
-    re.compile(r'<script', re.IGNORECASE),
-    re.compile(r'javascript:', re.IGNORECASE),
-    re.compile(r'data:', re.IGNORECASE),
-    re.compile(r'vbscript:', re.IGNORECASE),
-    re.compile(r'on\w+\s*=', re.IGNORECASE),
-]
+# Markup/script injection markers, one alternation so each input is scanned once
+SUSPICIOUS_PATTERN = re.compile(r'<script|javascript:|data:|vbscript:|on\w+\s*=', re.IGNORECASE)
+# Translation table deleting control characters except tab, newline and carriage return
+_CTRL_TRANS = dict.fromkeys([*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F])
+# Any character outside the date input whitelist, so scanning stops at the first bad one
+# (Unicode-aware \s, so pasted NBSP/thin spaces stay accepted)
+DATE_INPUT_DISALLOWED_PATTERN = re.compile(r'[^a-zA-Z0-9\s\.,!?\'"()-:;/@#\n\r]')
+USERNAME_PATTERN = re.compile(r'^[a-zA-Z0-9_]{1,32}\Z', re.ASCII)
 
 
 def sanitize_text(text: str) -> str:
@@ -46,7 +48,7 @@ def sanitize_text(text: str) -> str:
     text = text.strip()
     
     # Remove null bytes and other control characters (except newlines/tabs/carriage returns)
-    text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', text)
+    text = text.translate(_CTRL_TRANS)
     
     return text
 
@@ -78,10 +80,9 @@ def validate_reminder_text(text: str) -> str:
         raise ValidationError(f"Reminder text too long (max {MAX_REMINDER_LENGTH} characters)")
     
     # Check for suspicious patterns
-    for pattern in SUSPICIOUS_PATTERNS:
-        if pattern.search(text):
-            logger.warning(f"Blocked suspicious pattern in reminder text: {text[:50]}...")
-            raise ValidationError("Reminder text contains invalid content")
+    if SUSPICIOUS_PATTERN.search(text):
+        logger.warning(f"Blocked suspicious pattern in reminder text: {text[:50]}...")
+        raise ValidationError("Reminder text contains invalid content")
     
     # Log validation success
     logger.debug(f"Validated reminder text: {text[:50]}{'...' if len(text) > 50 else ''}")
@@ -116,14 +117,13 @@ def validate_date_input(text: str) -> str:
         raise ValidationError(f"Date input too long (max {MAX_DATE_INPUT_LENGTH} characters)")
     
     # Check for suspicious patterns
-    for pattern in SUSPICIOUS_PATTERNS:
-        if pattern.search(text):
-            logger.warning(f"Blocked suspicious pattern in date input: {text[:50]}...")
-            raise ValidationError("Date input contains invalid content")
+    if SUSPICIOUS_PATTERN.search(text):
+        logger.warning(f"Blocked suspicious pattern in date input: {text[:50]}...")
+        raise ValidationError("Date input contains invalid content")
     
     # Additional date-specific validation
     # Allow common date/time characters and words
-    if not re.match(r'^[a-zA-Z0-9\s\.,!?\'"()-:;/@#\n\r]+$', text):
+    if DATE_INPUT_DISALLOWED_PATTERN.search(text):
         logger.warning(f"Blocked invalid characters in date input: {text[:50]}...")
         raise ValidationError("Date input contains invalid characters")
     
@@ -188,22 +188,39 @@ def validate_username(username: Optional[str]) -> Optional[str]:
         return None
     
     # Telegram username validation
-    if not re.match(r'^[a-zA-Z0-9_]{1,32}$', username):
+    if not USERNAME_PATTERN.match(username):
         logger.warning(f"Invalid Telegram username format: {username}")
         raise ValidationError("Invalid username format")
     
     return username
 
 
-# Additional patterns to block for LLM safety
-LLM_INJECTION_PATTERNS = [
-    re.compile(r'ignore\s+(previous|above|all)', re.IGNORECASE),
-    re.compile(r'disregard\s+instructions', re.IGNORECASE),
-    re.compile(r'system\s*:', re.IGNORECASE),
-    re.compile(r'assistant\s*:', re.IGNORECASE),
-    re.compile(r'```', re.IGNORECASE),  # Code blocks
-    re.compile(r'\{.*"sgt_datetime"', re.IGNORECASE),  # Attempting to inject JSON
-]
+# Additional patterns to block for LLM safety, one alternation so each input is scanned once
+LLM_INJECTION_PATTERN = re.compile(
+    r'ignore\s+(?:previous|above|all)'
+    r'|disregard\s+instructions'
+    r'|system\s*:'
+    r'|assistant\s*:'
+    r'|```'  # Code blocks
+    r'|\{.*"sgt_datetime"',  # Attempting to inject JSON
+    re.IGNORECASE,
+)
+# Number of injection-stripping results memoized, date phrases repeat often
+LLM_SANITIZE_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=LLM_SANITIZE_CACHE_SIZE)
+def _strip_llm_injections(text: str) -> Tuple[str, int]:
+    """
+    Replace injection patterns with a placeholder (pure, memoized).
+    
+    Args:
+        text: Text already passed through sanitize_text
+        
+    Returns:
+        Tuple[str, int]: Cleaned text and number of replacements made
+    """
+    return LLM_INJECTION_PATTERN.subn("[REMOVED]", text)
 
 
 def sanitize_for_llm(text: str) -> str:
@@ -222,12 +239,12 @@ def sanitize_for_llm(text: str) -> str:
     if not text:
         return ""
     
-    # Remove any patterns that could be injection attempts
-    for pattern in LLM_INJECTION_PATTERNS:
-        if pattern.search(text):
-            logger.warning(f"Blocked potential LLM injection: {text[:50]}...")
-            # Replace suspicious content with a safe placeholder
-            text = pattern.sub("[REMOVED]", text)
+    # Replace anything that could be an injection attempt with a safe placeholder;
+    # the warning stays outside the cache so every attempt is logged
+    cleaned, removed = _strip_llm_injections(text)
+    if removed:
+        logger.warning(f"Blocked potential LLM injection: {text[:50]}...")
+        text = cleaned
     
     # Limit length specifically for LLM input
     max_llm_length = 300